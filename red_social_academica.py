@@ -1,759 +1,1375 @@
-# red_social_academica_avanzada.py
-# Sistema avanzado con visualización interactiva en el grafo
-
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import networkx as nx
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
-from collections import defaultdict
-import math
-
-# -----------------------------
-# Estado en memoria
-# -----------------------------
-nodes: dict[str, dict] = {}
-collaborations: list[tuple[str, str]] = []
-removed_nodes: set[str] = set()  # Nodos temporalmente removidos
-suggested_connections: list[tuple[str, str]] = []  # Conexiones sugeridas
-visualization_mode: str = "normal"  # normal, recommendations, resilience, gaps
-
-# -----------------------------
-# Colores por carrera
-# -----------------------------
-COLOR_MAP = {
-    "Ing.": "#87CEEB",
-    "Int.": "#90EE90",
-    "Med.": "#FA8072",
-    "Adm.": "#FFD700",
-    "Mat.": "#DDA0DD",
-    "Eco.": "#F0E68C",
-}
-
-# -----------------------------
-# Utilidades
-# -----------------------------
-def normalize_pair(a: str, b: str) -> tuple[str, str]:
-    return (a, b) if a <= b else (b, a)
-
-def parse_interests(text: str) -> set[str]:
-    return {p.strip() for p in text.split(",") if p.strip()}
-
-# -----------------------------
-# 1. RECOMENDACIÓN INTERDISCIPLINARIA
-# -----------------------------
-def calculate_interdisciplinary_score(n1: str, n2: str) -> float:
-    """Calcula puntuación de recomendación interdisciplinaria"""
-    if n1 not in nodes or n2 not in nodes:
-        return 0.0
-    
-    info1, info2 = nodes[n1], nodes[n2]
-    score = 0.0
-    
-    # Bonus por carreras diferentes (interdisciplinariedad)
-    if info1["carrera"] != info2["carrera"]:
-        score += 3.0
-    
-    # Coincidencia de intereses (Jaccard similarity)
-    int1, int2 = info1["intereses"], info2["intereses"]
-    if int1 or int2:
-        intersection = len(int1 & int2)
-        union = len(int1 | int2)
-        if union > 0:
-            jaccard = intersection / union
-            score += jaccard * 2.0
-    
-    return score
-
-def recommend_interdisciplinary_connections(top_n: int = 10) -> list[tuple[str, str, float]]:
-    """Genera recomendaciones de conexiones interdisciplinarias"""
-    recommendations = []
-    node_list = list(nodes.keys())
-    
-    for i, n1 in enumerate(node_list):
-        for n2 in node_list[i+1:]:
-            pair = normalize_pair(n1, n2)
-            if pair not in collaborations:
-                score = calculate_interdisciplinary_score(n1, n2)
-                if score > 0:
-                    recommendations.append((n1, n2, score))
-    
-    recommendations.sort(key=lambda x: x[2], reverse=True)
-    return recommendations[:top_n]
-
-# -----------------------------
-# 2. ANÁLISIS DE RESILIENCIA
-# -----------------------------
-def calculate_network_metrics(G: nx.Graph) -> dict:
-    """Calcula métricas básicas de la red"""
-    if len(G) == 0:
-        return {
-            "nodos": 0,
-            "aristas": 0,
-            "componentes": 0
-        }
-    
-    metrics = {
-        "nodos": G.number_of_nodes(),
-        "aristas": G.number_of_edges(),
-        "componentes": nx.number_connected_components(G)
-    }
-    
-    return metrics
-
-# -----------------------------
-# 3. DETECCIÓN DE BRECHAS (CENTRALIDAD Y SUGERENCIAS)
-# -----------------------------
-def calculate_centrality_metrics() -> dict:
-    """Calcula métricas de centralidad para todos los nodos"""
-    G = nx.Graph()
-    for n in nodes:
-        if n not in removed_nodes:
-            G.add_node(n)
-    for a, b in collaborations:
-        if a not in removed_nodes and b not in removed_nodes:
-            G.add_edge(a, b)
-    
-    if len(G) == 0 or G.number_of_edges() == 0:
-        return {}
-    
-    degree_cent = nx.degree_centrality(G)
-    betweenness_cent = nx.betweenness_centrality(G)
-    
-    # Combinar métricas
-    combined = {}
-    for node in G.nodes():
-        combined[node] = {
-            "grado": degree_cent.get(node, 0),
-            "intermediacion": betweenness_cent.get(node, 0),
-            "score_total": degree_cent.get(node, 0) * 0.5 + betweenness_cent.get(node, 0) * 0.5
-        }
-    
-    return combined
-
-def suggest_gap_filling_connections(top_n: int = 10) -> list[tuple[str, str, float, str]]:
-    """Sugiere conexiones para llenar brechas de conocimiento"""
-    suggestions = []
-    node_list = [n for n in nodes.keys() if n not in removed_nodes]
-    
-    # Calcular centralidad
-    centrality = calculate_centrality_metrics()
-    
-    for i, n1 in enumerate(node_list):
-        for n2 in node_list[i+1:]:
-            pair = normalize_pair(n1, n2)
-            if pair not in collaborations:
-                # Calcular similitud de intereses
-                int1, int2 = nodes[n1]["intereses"], nodes[n2]["intereses"]
-                common = int1 & int2
-                
-                if common:
-                    # Score basado en intereses comunes y centralidad
-                    similarity = len(common) / max(len(int1), len(int2))
-                    
-                    # Bonus si uno de los nodos es líder (alta centralidad)
-                    cent_bonus = 0
-                    if centrality:
-                        cent1 = centrality.get(n1, {}).get("score_total", 0)
-                        cent2 = centrality.get(n2, {}).get("score_total", 0)
-                        cent_bonus = max(cent1, cent2) * 0.5
-                    
-                    total_score = similarity + cent_bonus
-                    reason = f"Intereses: {', '.join(sorted(common))}"
-                    
-                    suggestions.append((n1, n2, total_score, reason))
-    
-    suggestions.sort(key=lambda x: x[2], reverse=True)
-    return suggestions[:top_n]
-
-# -----------------------------
-# Dibujar grafo con diferentes modos
-# -----------------------------
-def draw_graph():
-    global visualization_mode
-    
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
-
-    G = nx.Graph()
-    active_nodes = [n for n in nodes.keys() if n not in removed_nodes]
-    
-    for nombre in active_nodes:
-        info = nodes[nombre]
-        G.add_node(nombre, carrera=info["carrera"], intereses=info["intereses"])
-    
-    for a, b in collaborations:
-        if a not in removed_nodes and b not in removed_nodes:
-            G.add_edge(a, b)
-
-    fig = plt.Figure(figsize=(6.5, 5), dpi=100)
-    ax = fig.add_subplot(111)
-    
-    if visualization_mode == "normal":
-        ax.set_title("Red Académica - Vista Normal", fontsize=14, fontweight="bold")
-    elif visualization_mode == "recommendations":
-        ax.set_title("Red Académica - Recomendaciones Interdisciplinarias", fontsize=12, fontweight="bold")
-    elif visualization_mode == "resilience":
-        ax.set_title("Red Académica - Análisis de Resiliencia", fontsize=12, fontweight="bold")
-    elif visualization_mode == "gaps":
-        ax.set_title("Red Académica - Detección de Brechas", fontsize=12, fontweight="bold")
-
-    if len(G.nodes) == 0:
-        ax.text(0.5, 0.5, "(sin nodos activos)", ha="center", va="center", color="#777")
-        ax.axis("off")
-        canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
-        return
-
-    pos = nx.spring_layout(G, seed=42, k=1.2, iterations=100)
-    
-    # Dibujar según el modo
-    if visualization_mode == "normal":
-        # Vista normal
-        node_colors = [COLOR_MAP.get(G.nodes[n].get("carrera", ""), "#C0C0C0") for n in G.nodes()]
-        nx.draw_networkx_edges(G, pos, ax=ax, width=1.5, alpha=0.6, edge_color="#555")
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=650, edgecolors="black")
-        
-    elif visualization_mode == "recommendations":
-        # Mostrar recomendaciones interdisciplinarias en rojo punteado
-        node_colors = [COLOR_MAP.get(G.nodes[n].get("carrera", ""), "#C0C0C0") for n in G.nodes()]
-        nx.draw_networkx_edges(G, pos, ax=ax, width=1.5, alpha=0.6, edge_color="#555")
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=650, edgecolors="black")
-        
-        # Dibujar conexiones sugeridas
-        for n1, n2 in suggested_connections:
-            if n1 in pos and n2 in pos:
-                x1, y1 = pos[n1]
-                x2, y2 = pos[n2]
-                ax.plot([x1, x2], [y1, y2], 'r--', linewidth=2, alpha=0.7, zorder=1)
-        
-        # Leyenda
-        ax.plot([], [], 'r--', linewidth=2, label='Recomendaciones')
-        ax.legend(loc='upper right')
-        
-    elif visualization_mode == "resilience":
-        # Resaltar componentes desconectados con colores diferentes
-        components = list(nx.connected_components(G))
-        component_colors = ['#87CEEB', '#90EE90', '#FA8072', '#FFD700', '#DDA0DD']
-        
-        node_colors = []
-        for node in G.nodes():
-            for idx, component in enumerate(components):
-                if node in component:
-                    node_colors.append(component_colors[idx % len(component_colors)])
-                    break
-        
-        nx.draw_networkx_edges(G, pos, ax=ax, width=1.5, alpha=0.6, edge_color="#555")
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=650, 
-                              edgecolors="black", linewidths=2)
-        
-        # Mostrar métricas
-        metrics = calculate_network_metrics(G)
-        metrics_text = f"Componentes: {metrics['componentes']}\n"
-        metrics_text += f"Aristas: {metrics['aristas']}"
-        ax.text(0.02, 0.98, metrics_text, transform=ax.transAxes, 
-               fontsize=9, verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-        
-    elif visualization_mode == "gaps":
-        # Calcular centralidad y destacar nodos centrales
-        centrality = calculate_centrality_metrics()
-        
-        if centrality:
-            # Identificar top 3 nodos más centrales
-            sorted_by_centrality = sorted(centrality.items(), 
-                                         key=lambda x: x[1]["grado"], reverse=True)
-            top_central = {node for node, _ in sorted_by_centrality[:3]}
-            
-            node_colors = []
-            node_sizes = []
-            for node in G.nodes():
-                if node in top_central:
-                    node_colors.append("#FF4500")  # Naranja rojizo para nodos centrales
-                    node_sizes.append(900)
-                else:
-                    node_colors.append(COLOR_MAP.get(G.nodes[node].get("carrera", ""), "#C0C0C0"))
-                    node_sizes.append(650)
-        else:
-            node_colors = [COLOR_MAP.get(G.nodes[n].get("carrera", ""), "#C0C0C0") for n in G.nodes()]
-            node_sizes = [650 for _ in G.nodes()]
-        
-        nx.draw_networkx_edges(G, pos, ax=ax, width=1.5, alpha=0.6, edge_color="#555")
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=node_sizes, 
-                              edgecolors="black", linewidths=2)
-        
-        # Leyenda para nodos centrales
-        if centrality and top_central:
-            from matplotlib.lines import Line2D
-            legend_elements = [
-                Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF4500', 
-                      markersize=10, label='Nodos Centrales (Top 3)')
-            ]
-            ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
-    
-    nx.draw_networkx_labels(
-        G, pos, ax=ax,
-        font_size=9, font_weight="bold",
-        bbox=dict(facecolor="white", edgecolor="none", alpha=0.7, pad=1)
-    )
-
-    ax.axis("off")
-    canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True)
-
-# -----------------------------
-# Acciones básicas
-# -----------------------------
-def refresh_nodes_table(data: dict[str, dict] | None = None):
-    table = nodes_tv
-    for i in table.get_children():
-        table.delete(i)
-    src = data if data is not None else nodes
-    for nombre, info in src.items():
-        if nombre not in removed_nodes:
-            intereses_txt = ", ".join(sorted(info["intereses"])) if info["intereses"] else ""
-            table.insert("", "end", iid=nombre, values=(info["carrera"], intereses_txt), text=nombre)
-
-def refresh_collab_table():
-    table = collab_tv
-    for i in table.get_children():
-        table.delete(i)
-    for a, b in collaborations:
-        if a not in removed_nodes and b not in removed_nodes:
-            table.insert("", "end", values=(a, b))
-
-def add_or_update_node():
-    nombre = nodo_nombre_var.get().strip()
-    carrera = nodo_carrera_var.get().strip()
-    intereses = parse_interests(nodo_intereses_var.get())
-
-    if not nombre or not carrera:
-        messagebox.showwarning("Campos obligatorios", "Nombre y Carrera son obligatorios.")
-        return
-
-    nodes[nombre] = {"carrera": carrera, "intereses": intereses}
-    removed_nodes.discard(nombre)  # Si estaba removido, restaurarlo
-    refresh_nodes_table()
-    draw_graph()
-    messagebox.showinfo("Éxito", f"Nodo '{nombre}' agregado/actualizado.")
-
-def add_collaboration():
-    n1, n2 = colab_n1_var.get().strip(), colab_n2_var.get().strip()
-    if not n1 or not n2:
-        messagebox.showwarning("Campos obligatorios", "Nodo 1 y Nodo 2 son obligatorios.")
-        return
-    if n1 == n2:
-        messagebox.showwarning("Validación", "Seleccione dos nodos distintos.")
-        return
-    if n1 not in nodes or n2 not in nodes:
-        messagebox.showwarning("Validación", "Ambos nodos deben existir.")
-        return
-    pair = normalize_pair(n1, n2)
-    if pair in collaborations:
-        messagebox.showinfo("Duplicado", "La colaboración ya existe.")
-        return
-    collaborations.append(pair)
-    refresh_collab_table()
-    draw_graph()
-    messagebox.showinfo("Agregado", f"Colaboración {pair[0]} — {pair[1]} creada.")
-
-def delete_collaboration():
-    n1, n2 = colab_n1_var.get().strip(), colab_n2_var.get().strip()
-    if not n1 or not n2:
-        messagebox.showwarning("Campos obligatorios", "Nodo 1 y Nodo 2 son obligatorios.")
-        return
-    pair = normalize_pair(n1, n2)
-    if pair not in collaborations:
-        messagebox.showinfo("Sin cambios", "No se encontró esa colaboración.")
-        return
-    collaborations.remove(pair)
-    refresh_collab_table()
-    draw_graph()
-    messagebox.showinfo("Eliminado", f"Colaboración {pair[0]} — {pair[1]} eliminada.")
-
-# -----------------------------
-# Acciones avanzadas con visualización
-# -----------------------------
-def show_interdisciplinary_recommendations():
-    """Activa modo de recomendaciones interdisciplinarias"""
-    global visualization_mode, suggested_connections
-    
-    recommendations = recommend_interdisciplinary_connections(8)
-    
-    if not recommendations:
-        messagebox.showinfo("Recomendaciones", "No hay recomendaciones interdisciplinarias disponibles.")
-        return
-    
-    visualization_mode = "recommendations"
-    suggested_connections = [(n1, n2) for n1, n2, _ in recommendations]
-    draw_graph()
-    
-    # Mostrar ventana con detalles
-    window = tk.Toplevel(root)
-    window.title("Recomendaciones Interdisciplinarias")
-    window.geometry("700x450")
-    
-    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=80, height=16)
-    text.pack(padx=10, pady=10, fill="both", expand=True)
-    
-    text.insert(tk.END, "=== RECOMENDACIONES INTERDISCIPLINARIAS ===\n\n")
-    text.insert(tk.END, "Las líneas rojas punteadas en el grafo muestran las conexiones sugeridas.\n")
-    text.insert(tk.END, "Haga clic en 'Aplicar Conexión' para agregar la colaboración a la red.\n\n")
-    
-    for i, (n1, n2, score) in enumerate(recommendations, 1):
-        c1 = nodes[n1]["carrera"]
-        c2 = nodes[n2]["carrera"]
-        int1 = nodes[n1]["intereses"]
-        int2 = nodes[n2]["intereses"]
-        common = int1 & int2
-        
-        text.insert(tk.END, f"{i}. {n1} ({c1}) ↔ {n2} ({c2})\n")
-        text.insert(tk.END, f"   Puntuación: {score:.2f}\n")
-        if common:
-            text.insert(tk.END, f"   Intereses comunes: {', '.join(sorted(common))}\n")
-        text.insert(tk.END, "\n")
-    
-    text.config(state=tk.DISABLED)
-    
-    # Frame para aplicar conexiones
-    frame_bottom = ttk.Frame(window, padding=10)
-    frame_bottom.pack(fill="x")
-    
-    ttk.Label(frame_bottom, text="Aplicar conexión (formato: Nodo1,Nodo2):").pack(side="left", padx=5)
-    connection_var = tk.StringVar()
-    ttk.Entry(frame_bottom, textvariable=connection_var, width=25).pack(side="left", padx=5)
-    
-    def apply_connection():
-        conn = connection_var.get().strip()
-        if not conn:
-            messagebox.showwarning("Campo vacío", "Ingrese una conexión (ej: María,Pedro)")
-            return
-        
-        parts = [p.strip() for p in conn.split(",")]
-        if len(parts) != 2:
-            messagebox.showwarning("Formato inválido", "Use el formato: Nodo1,Nodo2")
-            return
-        
-        n1, n2 = parts
-        if n1 not in nodes or n2 not in nodes:
-            messagebox.showwarning("Nodos no existen", "Ambos nodos deben existir en la red.")
-            return
-        
-        pair = normalize_pair(n1, n2)
-        if pair in collaborations:
-            messagebox.showinfo("Ya existe", "Esta colaboración ya está en la red.")
-            return
-        
-        collaborations.append(pair)
-        refresh_collab_table()
-        draw_graph()
-        messagebox.showinfo("Éxito", f"Colaboración {n1} ↔ {n2} agregada a la red.")
-        connection_var.set("")
-    
-    ttk.Button(frame_bottom, text="Aplicar Conexión", command=apply_connection).pack(side="left", padx=5)
-    ttk.Button(frame_bottom, text="Cerrar", command=lambda: [window.destroy(), reset_normal_mode()]).pack(side="left", padx=5)
-
-def show_resilience_analysis():
-    """Activa modo de análisis de resiliencia"""
-    global visualization_mode
-    
-    window = tk.Toplevel(root)
-    window.title("Análisis de Resiliencia")
-    window.geometry("700x500")
-    
-    frame_top = ttk.Frame(window, padding=10)
-    frame_top.pack(fill="x")
-    
-    ttk.Label(frame_top, text="Simular eliminación del nodo:").grid(row=0, column=0, padx=5)
-    node_var = tk.StringVar()
-    combo = ttk.Combobox(frame_top, textvariable=node_var, 
-                         values=[n for n in nodes.keys() if n not in removed_nodes], width=20)
-    combo.grid(row=0, column=1, padx=5)
-    
-    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=80, height=20)
-    text.pack(padx=10, pady=10, fill="both", expand=True)
-    
-    def run_simulation():
-        node_name = node_var.get()
-        
-        if not node_name:
-            text.delete(1.0, tk.END)
-            text.insert(tk.END, "Por favor seleccione un nodo.\n")
-            return
-        
-        if node_name not in nodes or node_name in removed_nodes:
-            text.delete(1.0, tk.END)
-            text.insert(tk.END, f"El nodo '{node_name}' no está disponible.\n")
-            return
-        
-        # Calcular métricas antes
-        G_before = nx.Graph()
-        for n in nodes:
-            if n not in removed_nodes:
-                G_before.add_node(n)
-        for a, b in collaborations:
-            if a not in removed_nodes and b not in removed_nodes:
-                G_before.add_edge(a, b)
-        
-        metrics_before = calculate_network_metrics(G_before)
-        
-        # Remover nodo temporalmente
-        removed_nodes.add(node_name)
-        visualization_mode = "resilience"
-        draw_graph()
-        refresh_nodes_table()
-        refresh_collab_table()
-        
-        # Calcular métricas después
-        G_after = nx.Graph()
-        for n in nodes:
-            if n not in removed_nodes:
-                G_after.add_node(n)
-        for a, b in collaborations:
-            if a not in removed_nodes and b not in removed_nodes:
-                G_after.add_edge(a, b)
-        
-        metrics_after = calculate_network_metrics(G_after)
-        
-        text.delete(1.0, tk.END)
-        text.insert(tk.END, f"=== ANÁLISIS DE RESILIENCIA: Eliminación de '{node_name}' ===\n\n")
-        text.insert(tk.END, "El grafo ahora muestra la red sin el nodo eliminado.\n")
-        text.insert(tk.END, "Los componentes desconectados se muestran en diferentes colores.\n\n")
-        
-        text.insert(tk.END, "MÉTRICAS ANTES:\n")
-        for key, val in metrics_before.items():
-            text.insert(tk.END, f"  {key.capitalize()}: {val}\n")
-        
-        text.insert(tk.END, "\nMÉTRICAS DESPUÉS:\n")
-        for key, val in metrics_after.items():
-            text.insert(tk.END, f"  {key.capitalize()}: {val}\n")
-        
-        text.insert(tk.END, "\nIMPACTO:\n")
-        comp_change = metrics_after["componentes"] - metrics_before["componentes"]
-        edge_change = metrics_before["aristas"] - metrics_after["aristas"]
-        
-        text.insert(tk.END, f"  Componentes nuevos: {comp_change}\n")
-        text.insert(tk.END, f"  Conexiones perdidas: {edge_change}\n")
-        
-        if comp_change > 0:
-            text.insert(tk.END, f"\n⚠️ ALERTA: La red se fragmentó en {comp_change} componente(s) adicional(es)!\n")
-        if edge_change > 3:
-            text.insert(tk.END, f"⚠️ ALERTA: Se perdieron {edge_change} conexiones. ¡Nodo crítico!\n")
-    
-    def restore_node():
-        node_name = node_var.get()
-        if node_name in removed_nodes:
-            removed_nodes.remove(node_name)
-            visualization_mode = "normal"
-            draw_graph()
-            refresh_nodes_table()
-            refresh_collab_table()
-            text.delete(1.0, tk.END)
-            text.insert(tk.END, f"Nodo '{node_name}' restaurado. Red vuelta a la normalidad.\n")
-            combo['values'] = [n for n in nodes.keys() if n not in removed_nodes]
-    
-    ttk.Button(frame_top, text="🗑️ Simular Eliminación", command=run_simulation).grid(row=0, column=2, padx=5)
-    ttk.Button(frame_top, text="↩️ Restaurar Nodo", command=restore_node).grid(row=0, column=3, padx=5)
-    
-    frame_bottom = ttk.Frame(window, padding=10)
-    frame_bottom.pack(fill="x")
-    ttk.Button(frame_bottom, text="Cerrar y Restaurar Todo", 
-              command=lambda: [removed_nodes.clear(), window.destroy(), reset_normal_mode()]).pack()
-
-def show_gap_analysis():
-    """Activa modo de detección de brechas"""
-    global visualization_mode, suggested_connections
-    
-    centrality = calculate_centrality_metrics()
-    
-    visualization_mode = "gaps"
-    suggested_connections = []
-    draw_graph()
-    
-    window = tk.Toplevel(root)
-    window.title("Detección de Brechas de Conocimiento")
-    window.geometry("650x400")
-    
-    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=75, height=22)
-    text.pack(padx=10, pady=10, fill="both", expand=True)
-    
-    text.insert(tk.END, "=== LÍDERES EN LA RED (Centralidad de Grado) ===\n\n")
-    text.insert(tk.END, "Los nodos se destacan en color naranja rojizo para los top 3 más centrales.\n")
-    text.insert(tk.END, "La centralidad de grado indica cuántas conexiones tiene cada nodo.\n\n")
-    
-    if not centrality:
-        text.insert(tk.END, "No hay suficientes conexiones para calcular métricas.\n\n")
-    else:
-        sorted_nodes = sorted(centrality.items(), key=lambda x: x[1]["grado"], reverse=True)
-        
-        for i, (node, metrics) in enumerate(sorted_nodes[:10], 1):
-            carrera = nodes[node]["carrera"]
-            marker = "⭐" if i <= 3 else "  "
-            text.insert(tk.END, f"{marker} {i}. {node} ({carrera})\n")
-            text.insert(tk.END, f"   Centralidad de grado: {metrics['grado']:.3f}\n")
-            text.insert(tk.END, f"   Número de conexiones: {int(metrics['grado'] * (len(centrality) - 1))}\n\n")
-    
-    text.config(state=tk.DISABLED)
-    
-    ttk.Button(window, text="Cerrar", command=lambda: [window.destroy(), reset_normal_mode()]).pack(pady=5)
-
-def reset_normal_mode():
-    """Vuelve al modo de visualización normal"""
-    global visualization_mode, suggested_connections
-    visualization_mode = "normal"
-    suggested_connections = []
-    removed_nodes.clear()
-    draw_graph()
-    refresh_nodes_table()
-    refresh_collab_table()
-
-# -----------------------------
-# Datos de ejemplo
-# -----------------------------
-def seed_example_data():
-    example = [
-        ("María", "Ing.", {"IA", "Programación", "Algoritmos"}),
-        ("Ana", "Ing.", {"Sistemas", "IA", "Bases de datos"}),
-        ("Luis", "Int.", {"Redes", "Seguridad"}),
-        ("Carlos", "Ing.", {"Programación", "Web"}),
-        ("Sofía", "Int.", {"Datos", "IA", "Estadística"}),
-        ("Elena", "Med.", {"Biología", "Genética"}),
-        ("Jorge", "Adm.", {"Gestión", "Economía"}),
-        ("Pedro", "Mat.", {"Álgebra", "Algoritmos", "Lógica"}),
-        ("Laura", "Eco.", {"Economía", "Estadística", "Datos"}),
-    ]
-    for nombre, carrera, intereses in example:
-        nodes[nombre] = {"carrera": carrera, "intereses": set(intereses)}
-    for pair in [("Ana", "María"), ("Carlos", "María"), ("Sofía", "Ana"), ("Pedro", "María")]:
-        collaborations.append(normalize_pair(*pair))
-
-# -----------------------------
-# Construcción UI
-# -----------------------------
-root = tk.Tk()
-root.title("Red Social Académica - Sistema Avanzado Interactivo")
-root.geometry("1200x750")
-PAD = 6
-
-main = ttk.Frame(root)
-main.pack(fill="both", expand=True)
-
-left = ttk.Frame(main, padding=PAD)
-left.grid(row=0, column=0, sticky="nsew")
-separator = tk.Canvas(main, width=2, bg="#dddddd", highlightthickness=0)
-separator.grid(row=0, column=1, sticky="ns")
-right = ttk.Frame(main, padding=PAD)
-right.grid(row=0, column=2, sticky="nsew")
-
-main.columnconfigure(0, weight=3)
-main.columnconfigure(2, weight=2)
-main.rowconfigure(0, weight=1)
-
-# ---- Sección izquierda ----
-ttk.Label(left, text="Tabla Nodos", font=("TkDefaultFont", 10, "bold")).grid(row=0, column=0, sticky="w")
-nodes_tv = ttk.Treeview(left, columns=("carrera", "intereses"), show="tree headings", height=5)
-nodes_tv.heading("#0", text="Nombre")
-nodes_tv.heading("carrera", text="Carrera")
-nodes_tv.heading("intereses", text="Int.")
-nodes_tv.column("#0", width=120)
-nodes_tv.column("carrera", width=70)
-nodes_tv.column("intereses", width=220)
-nodes_tv.grid(row=1, column=0, sticky="ew")
-
-# Formulario Nodo
-nodo_nombre_var = tk.StringVar()
-nodo_carrera_var = tk.StringVar()
-nodo_intereses_var = tk.StringVar()
-frm_nodo = ttk.Frame(left)
-frm_nodo.grid(row=2, column=0, sticky="ew", pady=(2, 8))
-ttk.Label(frm_nodo, text="Nombre:").grid(row=0, column=0, sticky="w")
-ttk.Entry(frm_nodo, textvariable=nodo_nombre_var).grid(row=0, column=1, sticky="ew")
-ttk.Label(frm_nodo, text="Carrera:").grid(row=1, column=0, sticky="w")
-ttk.Entry(frm_nodo, textvariable=nodo_carrera_var).grid(row=1, column=1, sticky="ew")
-ttk.Label(frm_nodo, text="Intereses (coma):").grid(row=2, column=0, sticky="w")
-ttk.Entry(frm_nodo, textvariable=nodo_intereses_var).grid(row=2, column=1, sticky="ew")
-ttk.Button(frm_nodo, text="Agregar/Actualizar Nodo", command=add_or_update_node).grid(row=3, column=0, columnspan=2, sticky="ew")
-
-# Tabla Colaboraciones
-ttk.Label(left, text="Tabla Colaboraciones", font=("TkDefaultFont", 10, "bold")).grid(row=3, column=0, sticky="w")
-collab_tv = ttk.Treeview(left, columns=("n1", "n2"), show="headings", height=5)
-collab_tv.heading("n1", text="Nodo1")
-collab_tv.heading("n2", text="Nodo2")
-collab_tv.column("n1", width=120)
-collab_tv.column("n2", width=120)
-collab_tv.grid(row=4, column=0, sticky="ew")
-
-colab_n1_var = tk.StringVar()
-colab_n2_var = tk.StringVar()
-frm_colab = ttk.Frame(left)
-frm_colab.grid(row=5, column=0, sticky="ew", pady=(2, 8))
-ttk.Label(frm_colab, text="Nodo 1:").grid(row=0, column=0, sticky="w")
-ttk.Entry(frm_colab, textvariable=colab_n1_var).grid(row=0, column=1, sticky="ew")
-ttk.Label(frm_colab, text="Nodo 2:").grid(row=0, column=2, sticky="w")
-ttk.Entry(frm_colab, textvariable=colab_n2_var).grid(row=0, column=3, sticky="ew")
-ttk.Button(frm_colab, text="Agregar", command=add_collaboration).grid(row=1, column=0, columnspan=2, sticky="ew")
-ttk.Button(frm_colab, text="Eliminar", command=delete_collaboration).grid(row=1, column=2, columnspan=2, sticky="ew")
-
-# Panel de análisis avanzado
-ttk.Label(left, text="Análisis Avanzado Interactivo", font=("TkDefaultFont", 10, "bold")).grid(row=6, column=0, sticky="w", pady=(10, 2))
-frm_analysis = ttk.Frame(left)
-frm_analysis.grid(row=7, column=0, sticky="ew")
-frm_analysis.columnconfigure(0, weight=1)
-
-ttk.Button(frm_analysis, text="🔗 Recomendaciones Interdisciplinarias", 
-          command=show_interdisciplinary_recommendations).grid(row=0, column=0, sticky="ew", pady=2)
-ttk.Button(frm_analysis, text="🛡️ Análisis de Resiliencia", 
-          command=show_resilience_analysis).grid(row=1, column=0, sticky="ew", pady=2)
-ttk.Button(frm_analysis, text="🎯 Detección de Brechas", 
-          command=show_gap_analysis).grid(row=2, column=0, sticky="ew", pady=2)
-ttk.Button(frm_analysis, text="↩️ Restaurar Vista Normal", 
-          command=reset_normal_mode, style="Accent.TButton").grid(row=3, column=0, sticky="ew", pady=(8, 2))
-
-# ---- Sección derecha: Grafo ----
-ttk.Label(right, text="Visualización de la Red", font=("TkDefaultFont", 12, "bold")).grid(row=0, column=0, sticky="w")
-
-# Tabla de leyenda de colores
-legend_frame = ttk.LabelFrame(right, text="Leyenda de Carreras", padding=5)
-legend_frame.grid(row=1, column=0, sticky="ew", pady=(4, 4))
-
-# Crear tabla de leyenda
-legend_items = [
-    ("Ing.", "Ingeniería", "#87CEEB"),
-    ("Int.", "Inteligencia de negocios", "#90EE90"),
-    ("Med.", "Medicina", "#FA8072"),
-    ("Adm.", "Administración", "#FFD700"),
-    ("Mat.", "Matemáticas", "#DDA0DD"),
-    ("Eco.", "Economía", "#F0E68C"),
-]
-
-for i, (code, name, color) in enumerate(legend_items):
-    row = i // 2
-    col = (i % 2) * 3
-    
-    # Cuadro de color
-    color_canvas = tk.Canvas(legend_frame, width=20, height=20, bg=color, 
-                            highlightthickness=1, highlightbackground="black")
-    color_canvas.grid(row=row, column=col, padx=(5, 2), pady=2)
-    
-    # Texto
-    ttk.Label(legend_frame, text=f"{code} = {name}", font=("TkDefaultFont", 9)).grid(
-        row=row, column=col+1, sticky="w", padx=(0, 10), pady=2)
-
-graph_frame = ttk.Frame(right, width=380, height=360)
-graph_frame.grid(row=2, column=0, sticky="nsew", pady=(4, 8))
-
-right.rowconfigure(2, weight=1)
-right.columnconfigure(0, weight=1)
-
-# -----------------------------
-# Inicialización
-# -----------------------------
-seed_example_data()
-refresh_nodes_table()
-refresh_collab_table()
-draw_graph()
-
+# red_social_academica_avanzada.py
+# Sistema avanzado con visualización interactiva en el grafo
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog, font as tkfont
+import networkx as nx
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
+from matplotlib.collections import LineCollection
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import sys
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+    _prange = numba.prange
+except ImportError:  # numba es opcional: sin él se usa la ruta numpy
+    _NUMBA_AVAILABLE = False
+    _prange = range
+
+try:
+    import igraph as ig
+    _IGRAPH_AVAILABLE = True
+except ImportError:  # igraph es opcional: sin él se usa NetworkX
+    _IGRAPH_AVAILABLE = False
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    _PIL_AVAILABLE = True
+except ImportError:  # PIL es opcional: sin él se embebe el canvas Matplotlib
+    _PIL_AVAILABLE = False
+
+# -----------------------------
+# Estado en memoria
+# -----------------------------
+nodes: dict[str, dict] = {}
+collaborations: list[tuple[str, str]] = []
+_collab_set: set[tuple[str, str]] = set()  # Espejo de collaborations para búsquedas O(1)
+neighbors: dict[str, set[str]] = defaultdict(set)  # Adyacencia incremental
+removed_nodes: set[str] = set()  # Nodos temporalmente removidos
+suggested_connections: list[tuple[str, str]] = []  # Conexiones sugeridas
+visualization_mode: str = "normal"  # normal, recommendations, resilience, gaps
+_graph_version: int = 0  # Se incrementa en cada mutación de la red
+_centrality_cache: dict[int, dict] = {}
+_metrics_cache: dict[int, dict] = {}
+_executor = ThreadPoolExecutor(max_workers=2)  # Análisis pesados fuera del hilo de la UI
+
+# -----------------------------
+# Colores por carrera
+# -----------------------------
+COLOR_MAP = {
+    "Ing.": "#87CEEB",
+    "Int.": "#90EE90",
+    "Med.": "#FA8072",
+    "Adm.": "#FFD700",
+    "Mat.": "#DDA0DD",
+    "Eco.": "#F0E68C",
+}
+
+# -----------------------------
+# Utilidades
+# -----------------------------
+def normalize_pair(a: str, b: str) -> tuple[str, str]:
+    return (a, b) if a <= b else (b, a)
+
+def parse_interests(text: str) -> set[str]:
+    # Intern: etiquetas repetidas comparten el mismo objeto y las operaciones
+    # de conjuntos downstream comparan por puntero
+    return {sys.intern(s) for p in text.split(",") if (s := p.strip())}
+
+def _touch_graph() -> None:
+    """Registra una mutación de la red e invalida los cachés derivados"""
+    global _graph_version
+    _graph_version += 1
+
+_active_nodes_cache: tuple[int, list[str]] | None = None
+
+def get_active_nodes() -> list[str]:
+    """Lista de nodos activos, recalculada sólo cuando cambia la red"""
+    global _active_nodes_cache
+    version = _graph_version  # Capturada al entrar (puede llamarse desde el executor)
+    if _active_nodes_cache is None or _active_nodes_cache[0] != version:
+        _active_nodes_cache = (version, [n for n in nodes if n not in removed_nodes])
+    return _active_nodes_cache[1]
+
+def degree(n: str) -> int:
+    """Grado del nodo activo según la adyacencia incremental"""
+    if removed_nodes:
+        return len(neighbors[n] - removed_nodes)
+    return len(neighbors[n])
+
+_active_graph_cache: tuple[int, nx.Graph] | None = None
+
+def get_active_graph() -> nx.Graph:
+    """Grafo de nodos activos, reconstruido sólo cuando cambia la red"""
+    global _active_graph_cache
+    version = _graph_version  # Capturada al entrar (puede llamarse desde el executor)
+    if _active_graph_cache is not None and _active_graph_cache[0] == version:
+        return _active_graph_cache[1]
+    G = nx.Graph()
+    # Inserción por lotes: una sola llamada por colección en vez de un
+    # add_node/add_edge por elemento
+    G.add_nodes_from(get_active_nodes())
+    G.add_edges_from((a, b) for a, b in collaborations
+                     if a not in removed_nodes and b not in removed_nodes)
+    _active_graph_cache = (version, G)
+    return G
+
+# Cada carrera distinta recibe un entero pequeño: comparar ids es una sola
+# operación en vez de una comparación de cadenas por par, y el color se
+# resuelve indexando una lista paralela en vez de consultar COLOR_MAP
+_carrera_id: dict[str, int] = {}
+_carrera_colors: list[str] = []  # Color por id de carrera
+
+def _carrera_tag(carrera: str) -> int:
+    cid = _carrera_id.setdefault(carrera, len(_carrera_id))
+    if cid == len(_carrera_colors):
+        _carrera_colors.append(COLOR_MAP.get(carrera, "#C0C0C0"))
+    return cid
+
+# Índice global de intereses: cada interés distinto recibe un bit fijo,
+# así la similitud de conjuntos se reduce a operaciones bit a bit.
+_interest_index: dict[str, int] = {}
+
+def _interests_mask(intereses: set[str]) -> int:
+    """Empaqueta un conjunto de intereses en una máscara de bits"""
+    mask = 0
+    for interes in intereses:
+        bit = _interest_index.setdefault(interes, len(_interest_index))
+        mask |= 1 << bit
+    return mask
+
+# -----------------------------
+# 1. RECOMENDACIÓN INTERDISCIPLINARIA
+# -----------------------------
+def calculate_interdisciplinary_score(n1: str, n2: str) -> float:
+    """Calcula puntuación de recomendación interdisciplinaria"""
+    if n1 not in nodes or n2 not in nodes:
+        return 0.0
+    
+    info1, info2 = nodes[n1], nodes[n2]
+    score = 0.0
+    
+    # Bonus por carreras diferentes (interdisciplinariedad)
+    if info1["_carrera_id"] != info2["_carrera_id"]:
+        score += 3.0
+    
+    # Coincidencia de intereses (Jaccard sobre máscaras de bits)
+    m1, m2 = info1["_mask"], info2["_mask"]
+    union = (m1 | m2).bit_count()
+    if union:
+        score += 2.0 * (m1 & m2).bit_count() / union
+
+    return score
+
+def _interest_mask_matrix(node_list: list[str]) -> np.ndarray:
+    """Expande las máscaras de intereses a una matriz de palabras uint64 (SoA)"""
+    words = max(1, (len(_interest_index) + 63) // 64)
+    masks = np.zeros((len(node_list), words), dtype=np.uint64)
+    for i, nombre in enumerate(node_list):
+        mask = nodes[nombre]["_mask"]
+        for w in range(words):
+            masks[i, w] = (mask >> (64 * w)) & 0xFFFFFFFFFFFFFFFF
+    return masks
+
+def _popcount64(x):
+    """Popcount SWAR de 64 bits (apto para numba)"""
+    x = x - ((x >> 1) & 0x5555555555555555)
+    x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+    return (x * 0x0101010101010101) >> 56
+
+# np.bitwise_count llegó en numpy 2.0; con versiones anteriores el mismo
+# SWAR opera elemento a elemento sobre los arreglos uint64
+_np_popcount = getattr(np, "bitwise_count", _popcount64)
+
+def _score_topk_kernel(masks, carrera_ids, adj, k, best_scores, best_cols):
+    """Recorre los pares (i, j) en streaming manteniendo el top-K por fila,
+    sin materializar la matriz N×N de puntuaciones"""
+    n, words = masks.shape
+    for i in _prange(n):
+        for j in range(i + 1, n):
+            if adj[i, j]:
+                continue
+            inter = 0
+            union = 0
+            for w in range(words):
+                inter += _popcount64(masks[i, w] & masks[j, w])
+                union += _popcount64(masks[i, w] | masks[j, w])
+            score = 0.0
+            if carrera_ids[i] != carrera_ids[j]:
+                score += 3.0
+            if union > 0:
+                score += 2.0 * inter / union
+            if score <= 0.0:
+                continue
+            # K es pequeño: basta reemplazar el mínimo de la fila
+            m = 0
+            for t in range(1, k):
+                if best_scores[i, t] < best_scores[i, m]:
+                    m = t
+            if score > best_scores[i, m]:
+                best_scores[i, m] = score
+                best_cols[i, m] = j
+
+if _NUMBA_AVAILABLE:
+    _popcount64 = numba.njit(inline="always")(_popcount64)
+    _score_topk_kernel = numba.njit(parallel=True, cache=True)(_score_topk_kernel)
+
+def _recommend_numba(node_list: list[str], top_n: int) -> list[tuple[str, str, float]]:
+    """Ruta numba para redes grandes: memoria O(N·K) en vez de O(N²)"""
+    n = len(node_list)
+    masks = _interest_mask_matrix(node_list)
+    carrera_ids = np.fromiter((nodes[nombre]["_carrera_id"] for nombre in node_list),
+                              dtype=np.int64, count=n)
+
+    index = {nombre: i for i, nombre in enumerate(node_list)}
+    adj = np.zeros((n, n), dtype=np.bool_)
+    for a, b in collaborations:
+        if a in index and b in index:
+            adj[index[a], index[b]] = adj[index[b], index[a]] = True
+
+    k = max(1, min(top_n, n - 1))
+    best_scores = np.full((n, k), -1.0)
+    best_cols = np.full((n, k), -1, dtype=np.int64)
+    _score_topk_kernel(masks, carrera_ids, adj, k, best_scores, best_cols)
+
+    candidates = [
+        (best_scores[i, t], i, int(best_cols[i, t]))
+        for i in range(n) for t in range(k)
+        if best_cols[i, t] >= 0
+    ]
+    return [(node_list[i], node_list[j], float(s))
+            for s, i, j in heapq.nlargest(top_n, candidates)]
+
+def recommend_interdisciplinary_connections(top_n: int = 10) -> list[tuple[str, str, float]]:
+    """Genera recomendaciones de conexiones interdisciplinarias"""
+    node_list = list(nodes.keys())
+    n = len(node_list)
+    if n < 2:
+        return []
+
+    if _NUMBA_AVAILABLE and n > 200:
+        return _recommend_numba(node_list, top_n)
+
+    # Matriz de puntuaciones calculada en numpy en vez de pares en Python
+    masks = _interest_mask_matrix(node_list)
+    carreras = np.fromiter((nodes[nombre]["_carrera_id"] for nombre in node_list),
+                           dtype=np.int64, count=n)
+
+    inter = _np_popcount(masks[:, None, :] & masks[None, :, :]).sum(axis=-1)
+    union = _np_popcount(masks[:, None, :] | masks[None, :, :]).sum(axis=-1)
+    jaccard = np.divide(inter, union, out=np.zeros(inter.shape), where=union > 0)
+    scores = 3.0 * (carreras[:, None] != carreras[None, :]) + 2.0 * jaccard
+
+    # Descartar colaboraciones existentes, la diagonal y el triángulo inferior
+    index = {nombre: i for i, nombre in enumerate(node_list)}
+    for a, b in collaborations:
+        if a in index and b in index:
+            scores[index[a], index[b]] = -np.inf
+            scores[index[b], index[a]] = -np.inf
+    scores[np.tril_indices(n)] = -np.inf
+
+    # Top-K con argpartition: evita ordenar los N² pares completos
+    flat = scores.ravel()
+    k = min(top_n, flat.size)
+    top_idx = np.argpartition(-flat, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-flat[top_idx])]
+    rows, cols = np.unravel_index(top_idx, scores.shape)
+
+    return [
+        (node_list[i], node_list[j], float(score))
+        for i, j, score in zip(rows, cols, flat[top_idx])
+        if score > 0
+    ]
+
+# -----------------------------
+# 2. ANÁLISIS DE RESILIENCIA
+# -----------------------------
+class _DisjointSet:
+    """Union-find con compresión de caminos para componentes conexas"""
+
+    def __init__(self, elements):
+        self.parent = {e: e for e in elements}
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+_components_cache: tuple[int, list[set[str]]] | None = None
+
+def get_connected_components() -> list[set[str]]:
+    """Componentes conexas de la red activa, cacheadas por versión del grafo"""
+    global _components_cache
+    if _components_cache is not None and _components_cache[0] == _graph_version:
+        return _components_cache[1]
+    active = get_active_nodes()
+    dsu = _DisjointSet(active)
+    for a, b in collaborations:
+        if a not in removed_nodes and b not in removed_nodes:
+            dsu.union(a, b)
+    groups = defaultdict(set)
+    for n in active:
+        groups[dsu.find(n)].add(n)
+    components = list(groups.values())
+    _components_cache = (_graph_version, components)
+    return components
+
+def calculate_network_metrics(G: nx.Graph) -> dict:
+    """Calcula métricas básicas de la red"""
+    if len(G) == 0:
+        return {
+            "nodos": 0,
+            "aristas": 0,
+            "componentes": 0
+        }
+    
+    metrics = {
+        "nodos": G.number_of_nodes(),
+        "aristas": G.number_of_edges(),
+        "componentes": nx.number_connected_components(G)
+    }
+
+    return metrics
+
+def compute_resilience(node_name: str) -> tuple[dict, dict]:
+    """Métricas antes/después de remover un nodo, sin tocar el estado global
+    (apto para ejecutarse en un hilo de trabajo)"""
+    G_before = get_active_graph()
+    metrics_before = calculate_network_metrics(G_before)
+
+    G_after = nx.Graph()
+    G_after.add_nodes_from(n for n in G_before.nodes() if n != node_name)
+    G_after.add_edges_from((a, b) for a, b in G_before.edges() if node_name not in (a, b))
+    metrics_after = calculate_network_metrics(G_after)
+
+    return metrics_before, metrics_after
+
+def get_active_network_metrics(G: nx.Graph) -> dict:
+    """Métricas de la red activa, cacheadas por versión del grafo"""
+    version = _graph_version  # Capturada al entrar (el cálculo puede correr en el executor)
+    cached = _metrics_cache.get(version)
+    if cached is None:
+        cached = calculate_network_metrics(G)
+        _metrics_cache.clear()
+        _metrics_cache[version] = cached
+    return cached
+
+# -----------------------------
+# 3. DETECCIÓN DE BRECHAS (CENTRALIDAD Y SUGERENCIAS)
+# -----------------------------
+def _betweenness_centrality(G: nx.Graph) -> dict:
+    """Intermediación vía igraph (implementación en C, exacta) cuando está
+    disponible; si no, la aproximación muestreada de NetworkX"""
+    if _IGRAPH_AVAILABLE:
+        names = list(G.nodes())
+        g = ig.Graph()
+        g.add_vertices(names)
+        g.add_edges(list(G.edges()))
+        raw = g.betweenness(directed=False)
+        # Misma normalización que nx.betweenness_centrality(normalized=True)
+        n = len(names)
+        norm = 2.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        return {name: b * norm for name, b in zip(names, raw)}
+    # Betweenness aproximada por muestreo de fuentes: aquí sólo se usan los
+    # rankings, así que el error de muestreo no afecta a la interfaz
+    return nx.betweenness_centrality(G, k=min(500, len(G)), seed=42, normalized=True)
+
+def calculate_centrality_metrics() -> dict:
+    """Calcula métricas de centralidad para todos los nodos"""
+    # La versión se captura al entrar: en el executor la red puede mutar
+    # durante el cálculo, y el resultado viejo no debe cachearse bajo la
+    # versión nueva
+    version = _graph_version
+    cached = _centrality_cache.get(version)
+    if cached is not None:
+        return cached
+
+    G = get_active_graph()
+
+    if len(G) == 0 or G.number_of_edges() == 0:
+        _centrality_cache.clear()
+        _centrality_cache[version] = {}
+        return {}
+
+    degree_cent = nx.degree_centrality(G)
+    betweenness_cent = _betweenness_centrality(G)
+    
+    # Combinar métricas
+    combined = {}
+    for node in G.nodes():
+        combined[node] = {
+            "grado": degree_cent.get(node, 0),
+            "intermediacion": betweenness_cent.get(node, 0),
+            "score_total": degree_cent.get(node, 0) * 0.5 + betweenness_cent.get(node, 0) * 0.5
+        }
+
+    _centrality_cache.clear()
+    _centrality_cache[version] = combined
+    return combined
+
+def suggest_gap_filling_connections(top_n: int = 10) -> list[tuple[str, str, float, str]]:
+    """Sugiere conexiones para llenar brechas de conocimiento"""
+    suggestions = []
+    active = get_active_nodes()
+
+    # Índice invertido interés -> nodos: sólo se enumeran pares que comparten
+    # al menos un interés, en vez de los N² posibles
+    inv = defaultdict(list)
+    for n in active:
+        for interes in nodes[n]["intereses"]:
+            inv[interes].append(n)
+
+    candidates = set()
+    for holders in inv.values():
+        for i, a in enumerate(holders):
+            for b in holders[i+1:]:
+                candidates.add(normalize_pair(a, b))
+
+    # Calcular centralidad e izar la búsqueda anidada fuera del bucle
+    centrality = calculate_centrality_metrics()
+    cent_scores = {n: m["score_total"] for n, m in centrality.items()}
+
+    scored = []
+    for n1, n2 in candidates:
+        if (n1, n2) in _collab_set:
+            continue
+
+        # Score basado en intereses comunes y centralidad
+        m1, m2 = nodes[n1]["_mask"], nodes[n2]["_mask"]
+        common_mask = m1 & m2
+        if not common_mask:
+            continue
+        similarity = common_mask.bit_count() / max(m1.bit_count(), m2.bit_count())
+
+        # Bonus si uno de los nodos es líder (alta centralidad)
+        cent_bonus = max(cent_scores.get(n1, 0), cent_scores.get(n2, 0)) * 0.5
+        scored.append((n1, n2, similarity + cent_bonus))
+
+    # La razón sólo se formatea para los pares que realmente se devuelven
+    for n1, n2, total_score in heapq.nlargest(top_n, scored, key=lambda x: x[2]):
+        common = nodes[n1]["intereses"] & nodes[n2]["intereses"]
+        suggestions.append((n1, n2, total_score, f"Intereses: {', '.join(sorted(common))}"))
+    return suggestions
+
+# -----------------------------
+# Dibujar grafo con diferentes modos
+# -----------------------------
+_pos_cache: dict | None = None  # Última disposición calculada
+_pos_key: int | None = None  # Huella de la topología a la que corresponde
+_layout_inflight: int | None = None  # Huella con cálculo ya enviado al executor
+
+def _layout_key(G: nx.Graph) -> int:
+    """Huella del conjunto de nodos y aristas: ediciones que no tocan la
+    topología (p. ej. cambiar los intereses de un nodo) conservan la
+    disposición aunque la versión del grafo avance"""
+    return hash((frozenset(G.nodes()),
+                 frozenset(normalize_pair(a, b) for a, b in G.edges())))
+
+def invalidate_layout() -> None:
+    """Fuerza recalcular la disposición en el próximo redibujado"""
+    global _pos_cache, _pos_key
+    _pos_cache, _pos_key = None, None
+
+def _compute_layout(G: nx.Graph, prev: dict) -> dict:
+    """Disposición de fuerzas; arranca en caliente desde posiciones previas"""
+    if prev:
+        return nx.spring_layout(G, seed=42, k=1.2, iterations=20, pos=prev)
+    return nx.spring_layout(G, seed=42, k=1.2, iterations=100)
+
+# Figura, ejes y canvas persistentes: se crean una sola vez y cada redibujado
+# limpia los ejes en vez de destruir y reconstruir widgets
+_fig = None
+_ax = None
+_canvas = None
+_graph_canvas = None  # tk.Canvas destino de la ruta bitmap (con PIL)
+_graph_image_id = None
+_graph_photo = None  # Referencia viva del PhotoImage: sin ella Tk muestra en blanco
+
+def _get_canvas():
+    global _fig, _ax, _canvas, _graph_canvas, _graph_image_id
+    if _canvas is None:
+        _fig = plt.Figure(figsize=(6.5, 5), dpi=100)
+        _ax = _fig.add_subplot(111)
+        if _PIL_AVAILABLE:
+            # Renderizar fuera de pantalla con Agg y presentar el resultado
+            # como un único bitmap en un tk.Canvas plano: Tk sólo copia una
+            # imagen en vez de gestionar el widget Matplotlib completo
+            _canvas = FigureCanvasAgg(_fig)
+            _graph_canvas = tk.Canvas(graph_frame, highlightthickness=0, bg="white")
+            _graph_canvas.pack(fill="both", expand=True)
+            _graph_image_id = _graph_canvas.create_image(0, 0, anchor="nw")
+        else:
+            _canvas = FigureCanvasTkAgg(_fig, master=graph_frame)
+            _canvas.get_tk_widget().pack(fill="both", expand=True)
+    return _ax, _canvas
+
+def _push_bitmap():
+    """Copia el buffer RGBA del renderer Agg al tk.Canvas, ajustado al
+    tamaño actual del widget"""
+    global _graph_photo
+    img = Image.frombuffer("RGBA", _canvas.get_width_height(), _canvas.buffer_rgba())
+    w, h = _graph_canvas.winfo_width(), _graph_canvas.winfo_height()
+    if w > 1 and h > 1 and (w, h) != img.size:
+        # NEAREST: el reescalado interactivo prioriza latencia sobre calidad
+        escala = min(w / img.width, h / img.height)
+        img = img.resize((max(1, int(img.width * escala)), max(1, int(img.height * escala))),
+                         Image.Resampling.NEAREST)
+    _graph_photo = ImageTk.PhotoImage(img)
+    _graph_canvas.itemconfig(_graph_image_id, image=_graph_photo)
+
+def export_graph_png(path: str, size: tuple[int, int] | None = None) -> None:
+    """Exporta la vista actual del grafo a PNG; aquí el reescalado usa
+    LANCZOS (calidad sobre latencia, al revés que la vista en vivo)"""
+    if _canvas is None:
+        return  # Nada dibujado todavía
+    if not _PIL_AVAILABLE:
+        _fig.savefig(path, dpi=200)
+        return
+    _canvas.draw()
+    img = Image.frombuffer("RGBA", _canvas.get_width_height(), _canvas.buffer_rgba())
+    if size is not None and size != img.size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    img.save(path)
+
+def export_graph():
+    """Pide la ruta de destino y exporta la vista actual a doble resolución"""
+    path = filedialog.asksaveasfilename(defaultextension=".png",
+                                        filetypes=[("Imagen PNG", "*.png")])
+    if not path:
+        return
+    w, h = _canvas.get_width_height() if _canvas is not None else (650, 500)
+    export_graph_png(path, size=(2 * w, 2 * h))
+
+def _present():
+    """Lleva la figura a pantalla: rasteriza y copia el bitmap (ruta PIL)
+    o agenda el repintado del canvas embebido"""
+    if _PIL_AVAILABLE:
+        _canvas.draw()
+        _push_bitmap()
+    else:
+        _canvas.draw_idle()
+
+_edge_collection = None  # LineCollection de aristas del último dibujado
+_scatter_artist = None  # PathCollection de nodos del último dibujado
+
+def _draw_nodes(ax, G: nx.Graph, pos: dict, colors, sizes=650, linewidths=1.0):
+    """Dibuja todos los nodos como un único scatter sobre arreglos numpy,
+    sin el armado intermedio de draw_networkx_nodes. El artista queda
+    accesible a nivel de módulo para actualizaciones in situ y blitting"""
+    global _scatter_artist
+    if len(G) == 0:  # El recorte por viewport puede dejar la vista vacía
+        _scatter_artist = None
+        return None
+    xy = np.asarray([pos[n] for n in G.nodes()], dtype=float)
+    _scatter_artist = ax.scatter(xy[:, 0], xy[:, 1], c=colors, s=sizes,
+                                 edgecolors="black", linewidths=linewidths, zorder=2)
+    return _scatter_artist
+
+def _draw_edges(ax, G: nx.Graph, pos: dict) -> None:
+    """Dibuja todas las aristas como una única LineCollection: un artista
+    para el renderer en vez de uno por arista"""
+    global _edge_collection
+    segments = [(pos[a], pos[b]) for a, b in G.edges()]
+    _edge_collection = LineCollection(segments, colors="#555", linewidths=1.5, alpha=0.6)
+    ax.add_collection(_edge_collection)
+
+# Recorte por viewport: con límites activos sólo se dibuja lo que cae dentro
+# de la ventana visible. Todavía no hay UI de pan/zoom; set_view_limits es el
+# punto de extensión para conectarla
+_view_limits: tuple[float, float, float, float] | None = None
+
+def set_view_limits(limits: tuple[float, float, float, float] | None) -> None:
+    """Fija (xmin, xmax, ymin, ymax) como ventana visible; None muestra todo"""
+    global _view_limits
+    _view_limits = limits
+    schedule_redraw()
+
+def _visible_subgraph(G: nx.Graph, pos: dict) -> nx.Graph:
+    """Vista del grafo con sólo los nodos dentro de los límites de la vista"""
+    if _view_limits is None:
+        return G
+    xmin, xmax, ymin, ymax = _view_limits
+    return G.subgraph(n for n in G.nodes()
+                      if xmin <= pos[n][0] <= xmax and ymin <= pos[n][1] <= ymax)
+
+# Estado de blitting: fondo rasterizado y artista de resaltado reutilizable
+_blit_bg = None
+_highlight_artist = None
+_last_pos: dict = {}
+
+def draw_graph():
+    global visualization_mode, _pos_cache, _pos_key, _layout_inflight
+    global _blit_bg, _highlight_artist, _last_pos
+
+    ax, canvas = _get_canvas()
+    ax.clear()
+    # Un redibujado completo invalida el fondo capturado para blitting
+    _blit_bg = None
+    _highlight_artist = None
+    _last_pos = {}
+
+    G = get_active_graph()
+
+    if visualization_mode == "normal":
+        ax.set_title("Red Académica - Vista Normal", fontsize=14, fontweight="bold")
+    elif visualization_mode == "recommendations":
+        ax.set_title("Red Académica - Recomendaciones Interdisciplinarias", fontsize=12, fontweight="bold")
+    elif visualization_mode == "resilience":
+        ax.set_title("Red Académica - Análisis de Resiliencia", fontsize=12, fontweight="bold")
+    elif visualization_mode == "gaps":
+        ax.set_title("Red Académica - Detección de Brechas", fontsize=12, fontweight="bold")
+
+    if len(G.nodes) == 0:
+        ax.text(0.5, 0.5, "(sin nodos activos)", ha="center", va="center", color="#777")
+        ax.axis("off")
+        _present()
+        return
+
+    # Reutilizar la disposición si la topología no cambió (cambios de modo
+    # no pagan el costo del spring_layout). Si cambió, calcularla en un hilo
+    # de trabajo y redibujar cuando esté lista, sin bloquear la interfaz
+    key = _layout_key(G)
+    if _pos_key != key or _pos_cache is None:
+        prev = {n: p for n, p in (_pos_cache or {}).items() if n in G}
+        ax.text(0.5, 0.5, "(calculando disposición...)", ha="center", va="center", color="#777")
+        ax.axis("off")
+        _present()
+
+        if _layout_inflight == key:
+            return  # Esta topología ya tiene su cálculo en curso
+        _layout_inflight = key
+
+        def _apply_layout(fut):
+            global _pos_cache, _pos_key, _layout_inflight
+            if _layout_inflight == key:
+                _layout_inflight = None
+            if _layout_key(get_active_graph()) != key:
+                return  # Obsoleto: la mutación siguiente ya agendó su redibujado
+            _pos_cache, _pos_key = fut.result(), key
+            draw_graph()
+
+        fut = _executor.submit(_compute_layout, G, prev)
+        fut.add_done_callback(lambda f: root.after(0, lambda: _apply_layout(f)))
+        return
+
+    pos = _pos_cache
+    # Con límites de vista activos, los nodos/aristas/etiquetas fuera de la
+    # ventana ni siquiera llegan al renderer
+    G = _visible_subgraph(G, pos)
+
+    # Dibujar según el modo
+    if visualization_mode == "normal":
+        # Vista normal
+        node_colors = [_carrera_colors[nodes[n]["_carrera_id"]] for n in G.nodes()]
+        _draw_edges(ax, G, pos)
+        _draw_nodes(ax, G, pos, node_colors)
+        
+    elif visualization_mode == "recommendations":
+        # Mostrar recomendaciones interdisciplinarias en rojo punteado
+        node_colors = [_carrera_colors[nodes[n]["_carrera_id"]] for n in G.nodes()]
+        _draw_edges(ax, G, pos)
+        _draw_nodes(ax, G, pos, node_colors)
+        
+        # Dibujar conexiones sugeridas en un solo artista en vez de un
+        # Line2D por sugerencia
+        segments = [(pos[n1], pos[n2]) for n1, n2 in suggested_connections
+                    if n1 in pos and n2 in pos]
+        if segments:
+            ax.add_collection(LineCollection(segments, colors="red", linestyles="dashed",
+                                             linewidths=2, alpha=0.7, zorder=1))
+
+        # Leyenda
+        ax.plot([], [], 'r--', linewidth=2, label='Recomendaciones')
+        ax.legend(loc='upper right')
+        
+    elif visualization_mode == "resilience":
+        # Resaltar componentes desconectados con colores diferentes
+        components = get_connected_components()
+        component_colors = ['#87CEEB', '#90EE90', '#FA8072', '#FFD700', '#DDA0DD']
+        
+        node_colors = []
+        for node in G.nodes():
+            for idx, component in enumerate(components):
+                if node in component:
+                    node_colors.append(component_colors[idx % len(component_colors)])
+                    break
+        
+        _draw_edges(ax, G, pos)
+        _draw_nodes(ax, G, pos, node_colors, linewidths=2)
+        
+        # Mostrar métricas de la red activa completa: G puede ser la vista
+        # recortada por viewport y no debe contaminar el caché por versión
+        metrics = get_active_network_metrics(get_active_graph())
+        metrics_text = f"Componentes: {metrics['componentes']}\n"
+        metrics_text += f"Aristas: {metrics['aristas']}"
+        ax.text(0.02, 0.98, metrics_text, transform=ax.transAxes, 
+               fontsize=9, verticalalignment='top',
+               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        
+    elif visualization_mode == "gaps":
+        # Calcular centralidad y destacar nodos centrales
+        centrality = calculate_centrality_metrics()
+        
+        if centrality:
+            # Identificar top 3 nodos más centrales sin ordenar todo
+            top_central = {node for node, _ in heapq.nlargest(
+                3, centrality.items(), key=lambda x: x[1]["grado"])}
+            
+            node_colors = []
+            node_sizes = []
+            for node in G.nodes():
+                if node in top_central:
+                    node_colors.append("#FF4500")  # Naranja rojizo para nodos centrales
+                    node_sizes.append(900)
+                else:
+                    node_colors.append(_carrera_colors[nodes[node]["_carrera_id"]])
+                    node_sizes.append(650)
+        else:
+            node_colors = [_carrera_colors[nodes[n]["_carrera_id"]] for n in G.nodes()]
+            node_sizes = [650 for _ in G.nodes()]
+        
+        _draw_edges(ax, G, pos)
+        _draw_nodes(ax, G, pos, node_colors, sizes=node_sizes, linewidths=2)
+        
+        # Leyenda para nodos centrales
+        if centrality and top_central:
+            from matplotlib.lines import Line2D
+            legend_elements = [
+                Line2D([0], [0], marker='o', color='w', markerfacecolor='#FF4500', 
+                      markersize=10, label='Nodos Centrales (Top 3)')
+            ]
+            ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
+    
+    nx.draw_networkx_labels(
+        G, pos, ax=ax,
+        font_size=9, font_weight="bold",
+        bbox=dict(facecolor="white", edgecolor="none", alpha=0.7, pad=1)
+    )
+
+    ax.axis("off")
+    if _view_limits is not None:
+        xmin, xmax, ymin, ymax = _view_limits
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+    _last_pos = pos
+    _present()
+
+def update_highlight(node_name: str | None):
+    """Redibuja sólo el resaltado del nodo seleccionado vía blitting: se
+    restaura el fondo capturado y se dibuja un único artista encima, sin
+    re-rasterizar el resto del grafo"""
+    global _blit_bg, _highlight_artist
+    if _canvas is None or not _last_pos:
+        return
+    if _blit_bg is None:
+        _canvas.draw()  # Rasterizar el fondo una sola vez
+        _blit_bg = _canvas.copy_from_bbox(_ax.bbox)
+        _highlight_artist = _ax.scatter([], [], s=950, facecolors="none",
+                                        edgecolors="#FF8C00", linewidths=3, zorder=5)
+    _canvas.restore_region(_blit_bg)
+    if node_name in _last_pos:
+        _highlight_artist.set_offsets([_last_pos[node_name]])
+        _highlight_artist.set_visible(True)
+        _ax.draw_artist(_highlight_artist)
+    else:
+        _highlight_artist.set_visible(False)
+    if _PIL_AVAILABLE:
+        _push_bitmap()  # El buffer Agg ya tiene fondo + resaltado
+    else:
+        _canvas.blit(_ax.bbox)
+
+# -----------------------------
+# Redibujo diferido
+# -----------------------------
+_redraw_pending = False  # Ya hay un redibujado agendado
+
+def schedule_redraw():
+    """Colapsa ráfagas de solicitudes en un solo redibujado (~30 fps): la
+    primera agenda el temporizador y las siguientes sólo encuentran la
+    bandera encendida, sin cancelar ni reagendar nada"""
+    global _redraw_pending
+    if _redraw_pending:
+        return
+    _redraw_pending = True
+    root.after(33, _do_redraw)
+
+def _do_redraw():
+    global _redraw_pending
+    _redraw_pending = False
+    draw_graph()
+
+# -----------------------------
+# Acciones básicas
+# -----------------------------
+# Guardas de reentrada: si un refresco dispara eventos que vuelven a pedir
+# el mismo refresco, las peticiones solapadas se ignoran
+_nodes_refreshing = False
+_collab_refreshing = False
+
+def refresh_nodes_table(data: dict[str, dict] | None = None):
+    global _nodes_refreshing
+    if _nodes_refreshing:
+        return
+    _nodes_refreshing = True
+    try:
+        table = nodes_tv
+        # Borrado en una sola llamada: un relayout de Tk en vez de uno por fila
+        table.delete(*table.get_children())
+        src = data if data is not None else nodes
+        for nombre, info in src.items():
+            if nombre not in removed_nodes:
+                intereses_txt = ", ".join(sorted(info["intereses"])) if info["intereses"] else ""
+                table.insert("", "end", iid=nombre, values=(info["carrera"], intereses_txt), text=nombre)
+    finally:
+        _nodes_refreshing = False
+
+def refresh_collab_table():
+    global _collab_refreshing
+    if _collab_refreshing:
+        return
+    _collab_refreshing = True
+    try:
+        table = collab_tv
+        table.delete(*table.get_children())
+        for a, b in collaborations:
+            if a not in removed_nodes and b not in removed_nodes:
+                table.insert("", "end", values=(a, b))
+    finally:
+        _collab_refreshing = False
+
+def add_or_update_node():
+    nombre = nodo_nombre_var.get().strip()
+    carrera = nodo_carrera_var.get().strip()
+    intereses = parse_interests(nodo_intereses_var.get())
+
+    if not nombre or not carrera:
+        messagebox.showwarning("Campos obligatorios", "Nombre y Carrera son obligatorios.")
+        return
+
+    nodes[nombre] = {"carrera": carrera, "intereses": intereses,
+                     "_mask": _interests_mask(intereses), "_carrera_id": _carrera_tag(carrera)}
+    removed_nodes.discard(nombre)  # Si estaba removido, restaurarlo
+    _touch_graph()
+    refresh_nodes_table()
+    schedule_redraw()
+    messagebox.showinfo("Éxito", f"Nodo '{nombre}' agregado/actualizado.")
+
+def add_collaboration():
+    n1, n2 = colab_n1_var.get().strip(), colab_n2_var.get().strip()
+    if not n1 or not n2:
+        messagebox.showwarning("Campos obligatorios", "Nodo 1 y Nodo 2 son obligatorios.")
+        return
+    if n1 == n2:
+        messagebox.showwarning("Validación", "Seleccione dos nodos distintos.")
+        return
+    if n1 not in nodes or n2 not in nodes:
+        messagebox.showwarning("Validación", "Ambos nodos deben existir.")
+        return
+    pair = normalize_pair(n1, n2)
+    if pair in _collab_set:
+        messagebox.showinfo("Duplicado", "La colaboración ya existe.")
+        return
+    collaborations.append(pair)
+    _collab_set.add(pair)
+    neighbors[n1].add(n2)
+    neighbors[n2].add(n1)
+    _touch_graph()
+    refresh_collab_table()
+    schedule_redraw()
+    messagebox.showinfo("Agregado", f"Colaboración {pair[0]} — {pair[1]} creada.")
+
+def delete_collaboration():
+    n1, n2 = colab_n1_var.get().strip(), colab_n2_var.get().strip()
+    if not n1 or not n2:
+        messagebox.showwarning("Campos obligatorios", "Nodo 1 y Nodo 2 son obligatorios.")
+        return
+    pair = normalize_pair(n1, n2)
+    if pair not in _collab_set:
+        messagebox.showinfo("Sin cambios", "No se encontró esa colaboración.")
+        return
+    collaborations.remove(pair)
+    _collab_set.discard(pair)
+    neighbors[pair[0]].discard(pair[1])
+    neighbors[pair[1]].discard(pair[0])
+    _touch_graph()
+    refresh_collab_table()
+    schedule_redraw()
+    messagebox.showinfo("Eliminado", f"Colaboración {pair[0]} — {pair[1]} eliminada.")
+
+# -----------------------------
+# Acciones avanzadas con visualización
+# -----------------------------
+def show_interdisciplinary_recommendations():
+    """Activa modo de recomendaciones interdisciplinarias"""
+    global visualization_mode, suggested_connections
+    
+    recommendations = recommend_interdisciplinary_connections(8)
+    
+    if not recommendations:
+        messagebox.showinfo("Recomendaciones", "No hay recomendaciones interdisciplinarias disponibles.")
+        return
+    
+    visualization_mode = "recommendations"
+    suggested_connections = [(n1, n2) for n1, n2, _ in recommendations]
+    schedule_redraw()
+    
+    # Mostrar ventana con detalles
+    window = tk.Toplevel(root)
+    window.title("Recomendaciones Interdisciplinarias")
+    window.geometry("700x450")
+    
+    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=80, height=16)
+    text.pack(padx=10, pady=10, fill="both", expand=True)
+    
+    text.insert(tk.END, "=== RECOMENDACIONES INTERDISCIPLINARIAS ===\n\n")
+    text.insert(tk.END, "Las líneas rojas punteadas en el grafo muestran las conexiones sugeridas.\n")
+    text.insert(tk.END, "Haga clic en 'Aplicar Conexión' para agregar la colaboración a la red.\n\n")
+    
+    for i, (n1, n2, score) in enumerate(recommendations, 1):
+        c1 = nodes[n1]["carrera"]
+        c2 = nodes[n2]["carrera"]
+        int1 = nodes[n1]["intereses"]
+        int2 = nodes[n2]["intereses"]
+        common = int1 & int2
+        
+        text.insert(tk.END, f"{i}. {n1} ({c1}) ↔ {n2} ({c2})\n")
+        text.insert(tk.END, f"   Puntuación: {score:.2f}\n")
+        if common:
+            text.insert(tk.END, f"   Intereses comunes: {', '.join(sorted(common))}\n")
+        text.insert(tk.END, "\n")
+    
+    text.config(state=tk.DISABLED)
+    
+    # Frame para aplicar conexiones
+    frame_bottom = ttk.Frame(window, padding=10)
+    frame_bottom.pack(fill="x")
+    
+    ttk.Label(frame_bottom, text="Aplicar conexión (formato: Nodo1,Nodo2):").pack(side="left", padx=5)
+    connection_var = tk.StringVar()
+    ttk.Entry(frame_bottom, textvariable=connection_var, width=25).pack(side="left", padx=5)
+    
+    def apply_connection():
+        conn = connection_var.get().strip()
+        if not conn:
+            messagebox.showwarning("Campo vacío", "Ingrese una conexión (ej: María,Pedro)")
+            return
+        
+        parts = [p.strip() for p in conn.split(",")]
+        if len(parts) != 2:
+            messagebox.showwarning("Formato inválido", "Use el formato: Nodo1,Nodo2")
+            return
+        
+        n1, n2 = parts
+        if n1 not in nodes or n2 not in nodes:
+            messagebox.showwarning("Nodos no existen", "Ambos nodos deben existir en la red.")
+            return
+        
+        pair = normalize_pair(n1, n2)
+        if pair in _collab_set:
+            messagebox.showinfo("Ya existe", "Esta colaboración ya está en la red.")
+            return
+
+        collaborations.append(pair)
+        _collab_set.add(pair)
+        neighbors[n1].add(n2)
+        neighbors[n2].add(n1)
+        _touch_graph()
+        refresh_collab_table()
+        schedule_redraw()
+        messagebox.showinfo("Éxito", f"Colaboración {n1} ↔ {n2} agregada a la red.")
+        connection_var.set("")
+    
+    ttk.Button(frame_bottom, text="Aplicar Conexión", command=apply_connection).pack(side="left", padx=5)
+    ttk.Button(frame_bottom, text="Cerrar", command=lambda: [window.destroy(), reset_normal_mode()]).pack(side="left", padx=5)
+
+def show_resilience_analysis():
+    """Activa modo de análisis de resiliencia"""
+    window = tk.Toplevel(root)
+    window.title("Análisis de Resiliencia")
+    window.geometry("700x500")
+    
+    frame_top = ttk.Frame(window, padding=10)
+    frame_top.pack(fill="x")
+    
+    ttk.Label(frame_top, text="Simular eliminación del nodo:").grid(row=0, column=0, padx=5)
+    node_var = tk.StringVar()
+    combo = ttk.Combobox(frame_top, textvariable=node_var,
+                         values=get_active_nodes(), width=20)
+    combo.grid(row=0, column=1, padx=5)
+    
+    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=80, height=20)
+    text.pack(padx=10, pady=10, fill="both", expand=True)
+    
+    def run_simulation():
+        node_name = node_var.get()
+
+        if not node_name:
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, "Por favor seleccione un nodo.\n")
+            return
+
+        if node_name not in nodes or node_name in removed_nodes:
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, f"El nodo '{node_name}' no está disponible.\n")
+            return
+
+        # Computar en un hilo de trabajo para no congelar la interfaz;
+        # el resultado vuelve al hilo de Tk vía root.after
+        sim_btn.config(state="disabled")
+        text.delete(1.0, tk.END)
+        text.insert(tk.END, "Calculando...\n")
+        fut = _executor.submit(compute_resilience, node_name)
+        fut.add_done_callback(lambda f: root.after(0, lambda: show_simulation(node_name, f)))
+
+    def show_simulation(node_name, fut):
+        global visualization_mode
+
+        # La ventana pudo cerrarse mientras el cálculo seguía en el hilo de
+        # trabajo; tocar sus widgets destruidos lanzaría TclError
+        if not window.winfo_exists():
+            return
+        sim_btn.config(state="normal")
+        metrics_before, metrics_after = fut.result()
+
+        # Remover nodo temporalmente
+        removed_nodes.add(node_name)
+        _touch_graph()
+        visualization_mode = "resilience"
+        schedule_redraw()
+        refresh_nodes_table()
+        refresh_collab_table()
+
+        text.delete(1.0, tk.END)
+        text.insert(tk.END, f"=== ANÁLISIS DE RESILIENCIA: Eliminación de '{node_name}' ===\n\n")
+        text.insert(tk.END, "El grafo ahora muestra la red sin el nodo eliminado.\n")
+        text.insert(tk.END, "Los componentes desconectados se muestran en diferentes colores.\n\n")
+        
+        text.insert(tk.END, "MÉTRICAS ANTES:\n")
+        for key, val in metrics_before.items():
+            text.insert(tk.END, f"  {key.capitalize()}: {val}\n")
+        
+        text.insert(tk.END, "\nMÉTRICAS DESPUÉS:\n")
+        for key, val in metrics_after.items():
+            text.insert(tk.END, f"  {key.capitalize()}: {val}\n")
+        
+        text.insert(tk.END, "\nIMPACTO:\n")
+        comp_change = metrics_after["componentes"] - metrics_before["componentes"]
+        edge_change = metrics_before["aristas"] - metrics_after["aristas"]
+        
+        text.insert(tk.END, f"  Componentes nuevos: {comp_change}\n")
+        text.insert(tk.END, f"  Conexiones perdidas: {edge_change}\n")
+        
+        if comp_change > 0:
+            text.insert(tk.END, f"\n⚠️ ALERTA: La red se fragmentó en {comp_change} componente(s) adicional(es)!\n")
+        if edge_change > 3:
+            text.insert(tk.END, f"⚠️ ALERTA: Se perdieron {edge_change} conexiones. ¡Nodo crítico!\n")
+    
+    def restore_node():
+        global visualization_mode
+        node_name = node_var.get()
+        if node_name in removed_nodes:
+            removed_nodes.remove(node_name)
+            _touch_graph()
+            visualization_mode = "normal"
+            schedule_redraw()
+            refresh_nodes_table()
+            refresh_collab_table()
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, f"Nodo '{node_name}' restaurado. Red vuelta a la normalidad.\n")
+            combo['values'] = get_active_nodes()
+    
+    sim_btn = ttk.Button(frame_top, text="🗑️ Simular Eliminación", command=run_simulation)
+    sim_btn.grid(row=0, column=2, padx=5)
+    ttk.Button(frame_top, text="↩️ Restaurar Nodo", command=restore_node).grid(row=0, column=3, padx=5)
+    
+    frame_bottom = ttk.Frame(window, padding=10)
+    frame_bottom.pack(fill="x")
+    ttk.Button(frame_bottom, text="Cerrar y Restaurar Todo",
+              command=lambda: [window.destroy(), reset_normal_mode()]).pack()
+
+def show_gap_analysis():
+    """Activa modo de detección de brechas"""
+    global visualization_mode, suggested_connections
+
+    visualization_mode = "gaps"
+    suggested_connections = []
+
+    window = tk.Toplevel(root)
+    window.title("Detección de Brechas de Conocimiento")
+    window.geometry("650x400")
+
+    text = scrolledtext.ScrolledText(window, wrap=tk.WORD, width=75, height=22)
+    text.pack(padx=10, pady=10, fill="both", expand=True)
+    text.insert(tk.END, "Calculando métricas de centralidad...\n")
+
+    def show_results(fut):
+        # La ventana pudo cerrarse mientras la centralidad se calculaba
+        if not window.winfo_exists():
+            return
+        centrality = fut.result()
+        schedule_redraw()
+
+        text.delete(1.0, tk.END)
+        text.insert(tk.END, "=== LÍDERES EN LA RED (Centralidad de Grado) ===\n\n")
+        text.insert(tk.END, "Los nodos se destacan en color naranja rojizo para los top 3 más centrales.\n")
+        text.insert(tk.END, "La centralidad de grado indica cuántas conexiones tiene cada nodo.\n\n")
+
+        if not centrality:
+            text.insert(tk.END, "No hay suficientes conexiones para calcular métricas.\n\n")
+        else:
+            top_nodes = heapq.nlargest(10, centrality.items(), key=lambda x: x[1]["grado"])
+
+            for i, (node, metrics) in enumerate(top_nodes, 1):
+                carrera = nodes[node]["carrera"]
+                marker = "⭐" if i <= 3 else "  "
+                text.insert(tk.END, f"{marker} {i}. {node} ({carrera})\n")
+                text.insert(tk.END, f"   Centralidad de grado: {metrics['grado']:.3f}\n")
+                text.insert(tk.END, f"   Número de conexiones: {degree(node)}\n\n")
+
+        text.config(state=tk.DISABLED)
+
+    # La centralidad (la parte pesada) se calcula en un hilo de trabajo
+    fut = _executor.submit(calculate_centrality_metrics)
+    fut.add_done_callback(lambda f: root.after(0, lambda: show_results(f)))
+
+    ttk.Button(window, text="Cerrar", command=lambda: [window.destroy(), reset_normal_mode()]).pack(pady=5)
+
+def reset_normal_mode():
+    """Vuelve al modo de visualización normal"""
+    global visualization_mode, suggested_connections
+    visualization_mode = "normal"
+    suggested_connections = []
+    if removed_nodes:
+        removed_nodes.clear()
+        _touch_graph()
+    schedule_redraw()
+    refresh_nodes_table()
+    refresh_collab_table()
+
+# -----------------------------
+# Datos de ejemplo
+# -----------------------------
+def seed_example_data():
+    example = [
+        ("María", "Ing.", {"IA", "Programación", "Algoritmos"}),
+        ("Ana", "Ing.", {"Sistemas", "IA", "Bases de datos"}),
+        ("Luis", "Int.", {"Redes", "Seguridad"}),
+        ("Carlos", "Ing.", {"Programación", "Web"}),
+        ("Sofía", "Int.", {"Datos", "IA", "Estadística"}),
+        ("Elena", "Med.", {"Biología", "Genética"}),
+        ("Jorge", "Adm.", {"Gestión", "Economía"}),
+        ("Pedro", "Mat.", {"Álgebra", "Algoritmos", "Lógica"}),
+        ("Laura", "Eco.", {"Economía", "Estadística", "Datos"}),
+    ]
+    # Carga por lotes: se arman las estructuras completas y se vuelcan de
+    # una vez sobre el estado global, con una sola invalidación al final
+    nodes.update({nombre: {"carrera": carrera, "intereses": set(intereses),
+                           "_mask": _interests_mask(intereses), "_carrera_id": _carrera_tag(carrera)}
+                  for nombre, carrera, intereses in example})
+    pairs = [normalize_pair(*p)
+             for p in [("Ana", "María"), ("Carlos", "María"), ("Sofía", "Ana"), ("Pedro", "María")]]
+    collaborations.extend(pairs)
+    _collab_set.update(pairs)
+    for a, b in pairs:
+        neighbors[a].add(b)
+        neighbors[b].add(a)
+    _touch_graph()
+
+# -----------------------------
+# Construcción UI
+# -----------------------------
+root = tk.Tk()
+root.title("Red Social Académica - Sistema Avanzado Interactivo")
+root.geometry("1200x750")
+PAD = 6
+
+# Fuentes compartidas: una tupla inline obliga a Tk a resolver la fuente en
+# cada widget; estos objetos Font se crean una sola vez y se reutilizan
+HEADER_FONT = tkfont.Font(font=("TkDefaultFont", 12, "bold"))
+SECTION_FONT = tkfont.Font(font=("TkDefaultFont", 10, "bold"))
+LEGEND_FONT = tkfont.Font(font=("TkDefaultFont", 9))
+
+main = ttk.Frame(root)
+main.pack(fill="both", expand=True)
+
+left = ttk.Frame(main, padding=PAD)
+left.grid(row=0, column=0, sticky="nsew")
+separator = tk.Canvas(main, width=2, bg="#dddddd", highlightthickness=0)
+separator.grid(row=0, column=1, sticky="ns")
+right = ttk.Frame(main, padding=PAD)
+right.grid(row=0, column=2, sticky="nsew")
+
+main.columnconfigure(0, weight=3)
+main.columnconfigure(2, weight=2)
+main.rowconfigure(0, weight=1)
+
+# ---- Sección izquierda ----
+ttk.Label(left, text="Tabla Nodos", font=SECTION_FONT).grid(row=0, column=0, sticky="w")
+nodes_tv = ttk.Treeview(left, columns=("carrera", "intereses"), show="tree headings", height=5)
+nodes_tv.heading("#0", text="Nombre")
+nodes_tv.heading("carrera", text="Carrera")
+nodes_tv.heading("intereses", text="Int.")
+nodes_tv.column("#0", width=120)
+nodes_tv.column("carrera", width=70)
+nodes_tv.column("intereses", width=220)
+nodes_tv.grid(row=1, column=0, sticky="ew")
+
+def _on_node_select(_event=None):
+    sel = nodes_tv.selection()
+    update_highlight(sel[0] if sel else None)
+
+# Seleccionar una fila resalta el nodo por blitting, sin redibujo completo
+nodes_tv.bind("<<TreeviewSelect>>", _on_node_select)
+
+# Formulario Nodo
+nodo_nombre_var = tk.StringVar()
+nodo_carrera_var = tk.StringVar()
+nodo_intereses_var = tk.StringVar()
+frm_nodo = ttk.Frame(left)
+frm_nodo.grid(row=2, column=0, sticky="ew", pady=(2, 8))
+ttk.Label(frm_nodo, text="Nombre:").grid(row=0, column=0, sticky="w")
+ttk.Entry(frm_nodo, textvariable=nodo_nombre_var).grid(row=0, column=1, sticky="ew")
+ttk.Label(frm_nodo, text="Carrera:").grid(row=1, column=0, sticky="w")
+ttk.Entry(frm_nodo, textvariable=nodo_carrera_var).grid(row=1, column=1, sticky="ew")
+ttk.Label(frm_nodo, text="Intereses (coma):").grid(row=2, column=0, sticky="w")
+ttk.Entry(frm_nodo, textvariable=nodo_intereses_var).grid(row=2, column=1, sticky="ew")
+ttk.Button(frm_nodo, text="Agregar/Actualizar Nodo", command=add_or_update_node).grid(row=3, column=0, columnspan=2, sticky="ew")
+
+# Tabla Colaboraciones
+ttk.Label(left, text="Tabla Colaboraciones", font=SECTION_FONT).grid(row=3, column=0, sticky="w")
+collab_tv = ttk.Treeview(left, columns=("n1", "n2"), show="headings", height=5)
+collab_tv.heading("n1", text="Nodo1")
+collab_tv.heading("n2", text="Nodo2")
+collab_tv.column("n1", width=120)
+collab_tv.column("n2", width=120)
+collab_tv.grid(row=4, column=0, sticky="ew")
+
+colab_n1_var = tk.StringVar()
+colab_n2_var = tk.StringVar()
+frm_colab = ttk.Frame(left)
+frm_colab.grid(row=5, column=0, sticky="ew", pady=(2, 8))
+ttk.Label(frm_colab, text="Nodo 1:").grid(row=0, column=0, sticky="w")
+ttk.Entry(frm_colab, textvariable=colab_n1_var).grid(row=0, column=1, sticky="ew")
+ttk.Label(frm_colab, text="Nodo 2:").grid(row=0, column=2, sticky="w")
+ttk.Entry(frm_colab, textvariable=colab_n2_var).grid(row=0, column=3, sticky="ew")
+ttk.Button(frm_colab, text="Agregar", command=add_collaboration).grid(row=1, column=0, columnspan=2, sticky="ew")
+ttk.Button(frm_colab, text="Eliminar", command=delete_collaboration).grid(row=1, column=2, columnspan=2, sticky="ew")
+
+# Panel de análisis avanzado
+ttk.Label(left, text="Análisis Avanzado Interactivo", font=SECTION_FONT).grid(row=6, column=0, sticky="w", pady=(10, 2))
+frm_analysis = ttk.Frame(left)
+frm_analysis.grid(row=7, column=0, sticky="ew")
+frm_analysis.columnconfigure(0, weight=1)
+
+ttk.Button(frm_analysis, text="🔗 Recomendaciones Interdisciplinarias", 
+          command=show_interdisciplinary_recommendations).grid(row=0, column=0, sticky="ew", pady=2)
+ttk.Button(frm_analysis, text="🛡️ Análisis de Resiliencia", 
+          command=show_resilience_analysis).grid(row=1, column=0, sticky="ew", pady=2)
+ttk.Button(frm_analysis, text="🎯 Detección de Brechas", 
+          command=show_gap_analysis).grid(row=2, column=0, sticky="ew", pady=2)
+ttk.Button(frm_analysis, text="💾 Exportar Grafo a PNG",
+          command=export_graph).grid(row=3, column=0, sticky="ew", pady=2)
+ttk.Button(frm_analysis, text="↩️ Restaurar Vista Normal",
+          command=reset_normal_mode, style="Accent.TButton").grid(row=4, column=0, sticky="ew", pady=(8, 2))
+
+# ---- Sección derecha: Grafo ----
+ttk.Label(right, text="Visualización de la Red", font=HEADER_FONT).grid(row=0, column=0, sticky="w")
+
+# Tabla de leyenda de colores
+legend_frame = ttk.LabelFrame(right, text="Leyenda de Carreras", padding=5)
+legend_frame.grid(row=1, column=0, sticky="ew", pady=(4, 4))
+
+# Crear tabla de leyenda. Cada ítem lleva el color hex (para Tk) y el RGB
+# uint8 ya convertido, así PIL/Matplotlib no re-parsean la cadena por dibujo
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+legend_items = [(code, name, color, _hex_to_rgb(color)) for code, name, color in [
+    ("Ing.", "Ingeniería", "#87CEEB"),
+    ("Int.", "Inteligencia de negocios", "#90EE90"),
+    ("Med.", "Medicina", "#FA8072"),
+    ("Adm.", "Administración", "#FFD700"),
+    ("Mat.", "Matemáticas", "#DDA0DD"),
+    ("Eco.", "Economía", "#F0E68C"),
+]]
+
+if _PIL_AVAILABLE:
+    # Leyenda pre-renderizada como un único bitmap: Tk gestiona un solo
+    # Label con una imagen en vez de una grilla de muestras y etiquetas
+    _LEGEND_ROW_H, _LEGEND_COL_W, _LEGEND_SWATCH = 26, 215, 20
+    _legend_bg = ttk.Style().lookup("TLabelframe", "background") or "#d9d9d9"
+    # El lookup puede devolver un nombre de color del sistema (p. ej.
+    # "SystemButtonFace" en Windows) que PIL no entiende; winfo_rgb lo
+    # resuelve a 16 bits por canal, que se reducen a uint8
+    _legend_bg = tuple(c // 256 for c in root.winfo_rgb(_legend_bg))
+    _legend_img = Image.new("RGB", (2 * _LEGEND_COL_W,
+                                    ((len(legend_items) + 1) // 2) * _LEGEND_ROW_H), _legend_bg)
+    _legend_draw = ImageDraw.Draw(_legend_img)
+    for i, (code, name, _color, rgb) in enumerate(legend_items):
+        x = (i % 2) * _LEGEND_COL_W + 5
+        y = (i // 2) * _LEGEND_ROW_H + 3
+        _legend_draw.rectangle((x, y, x + _LEGEND_SWATCH, y + _LEGEND_SWATCH),
+                               fill=rgb, outline="black")
+        _legend_draw.text((x + _LEGEND_SWATCH + 8, y + 4), f"{code} = {name}", fill="black")
+    _legend_photo = ImageTk.PhotoImage(_legend_img)  # referencia viva para evitar el GC
+    ttk.Label(legend_frame, image=_legend_photo).grid(row=0, column=0, sticky="w")
+else:
+    # Sin PIL la leyenda es un único Treeview con una fila por carrera y el
+    # color aplicado como fondo vía tags: un solo widget en vez de una
+    # grilla de muestras y etiquetas
+    legend_tv = ttk.Treeview(legend_frame, columns=("desc",), show="",
+                             height=len(legend_items), selectmode="none")
+    legend_tv.column("desc", width=260)
+    for i, (code, name, color, _rgb) in enumerate(legend_items):
+        tag = f"carrera{i}"
+        legend_tv.insert("", "end", values=(f"{code} = {name}",), tags=(tag,))
+        legend_tv.tag_configure(tag, background=color, font=LEGEND_FONT)
+    legend_tv.grid(row=0, column=0, sticky="ew")
+
+graph_frame = ttk.Frame(right, width=380, height=360)
+
+# El grafo se posiciona con place bajo la leyenda: grid ya no tiene que
+# resolver pesos de fila en cada cambio de tamaño. Un único <Configure>
+# del panel derecho reubica el frame, coalescido con after_idle para que
+# las ráfagas de eventos de redimensionado cuesten una sola pasada
+_graph_geom_pending = False
+
+def _place_graph_frame():
+    global _graph_geom_pending
+    _graph_geom_pending = False
+    x = legend_frame.winfo_x()
+    y = legend_frame.winfo_y() + legend_frame.winfo_height() + 4
+    graph_frame.place(x=x, y=y,
+                      width=max(1, right.winfo_width() - 2 * x),
+                      height=max(1, right.winfo_height() - y - PAD))
+
+def _on_right_configure(_event=None):
+    global _graph_geom_pending
+    if _graph_geom_pending:
+        return
+    _graph_geom_pending = True
+    root.after_idle(_place_graph_frame)
+
+right.bind("<Configure>", _on_right_configure)
+
+right.columnconfigure(0, weight=1)
+
+# -----------------------------
+# Inicialización
+# -----------------------------
+def _initial_populate():
+    """Puebla la interfaz en un solo lote tras la primera pasada de geometría"""
+    seed_example_data()
+    refresh_nodes_table()
+    refresh_collab_table()
+    draw_graph()
+
+root.after_idle(_initial_populate)
 root.mainloop()
\ No newline at end of file